@@ -15,9 +15,13 @@ Rust linear algebra crates across dimensions.
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
 import hashlib
 import json
 import math
+import operator
+import os
 import platform
 import re
 import shutil
@@ -25,7 +29,8 @@ import subprocess
 import sys
 import tempfile
 import tomllib
-from dataclasses import dataclass, field as dataclass_field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field as dataclass_field, replace
 from pathlib import Path
 from typing import Final, Protocol, TypeGuard, cast
 
@@ -50,7 +55,7 @@ class PlotRequest:
     out_svg: Path
     title: str
     stat: str
-    dims: tuple[int, ...]
+    rows: tuple[Row, ...]
     la_label: str
     na_label: str
     fa_label: str
@@ -249,6 +254,9 @@ METRICS: Final[dict[str, Metric]] = {
     ),
 }
 
+# Pseudo-metric selecting every entry in METRICS for one exploratory run.
+ALL_METRICS: Final[str] = "all"
+
 CANONICAL_DIMS: Final[tuple[int, ...]] = (2, 3, 4, 5, 8, 16, 32, 64)
 _PUBLICATION_GATE: Final[tuple[str, ...]] = ("just", "test-bench-inputs")
 _PUBLICATION_BENCHMARK_BASE: Final[tuple[str, ...]] = (
@@ -261,6 +269,14 @@ _PUBLICATION_BENCHMARK_BASE: Final[tuple[str, ...]] = (
     "vs_linalg",
 )
 _COMMAND_TIMEOUT_SECONDS: Final[int] = 7200
+_MAX_READ_WORKERS: Final[int] = 32
+# Errors meaning "this estimates file does not exist", matching what Path.exists() treats as absent.
+_MISSING_FILE_ERRORS: Final[tuple[type[OSError], ...]] = (FileNotFoundError, NotADirectoryError)
+_CSV_HEADER: Final[tuple[str, ...]] = ("D", "la_stack", "la_lo", "la_hi", "nalgebra", "na_lo", "na_hi", "faer", "fa_lo", "fa_hi")
+# Pulls one CSV record out of a Row in a single C-level call, in _CSV_HEADER order.
+_CSV_ROW_VALUES: Final = operator.attrgetter("dim", "la_time", "la_lo", "la_hi", "na_time", "na_lo", "na_hi", "fa_time", "fa_lo", "fa_hi")
+_MARKDOWN_ROW_TIMES: Final = operator.attrgetter("dim", "la_time", "na_time", "fa_time")
+_MARKDOWN_ROW_FORMAT: Final = "| {} | {:,.3f} | {:,.3f} | {:,.3f} | {} | {} |".format
 _PROVENANCE_HARNESS_FILES: Final[tuple[str, ...]] = (
     "Cargo.toml",
     "Cargo.lock",
@@ -269,17 +285,22 @@ _PROVENANCE_HARNESS_FILES: Final[tuple[str, ...]] = (
     "tests/exact_bench_config.rs",
     "tests/vs_linalg_inputs.rs",
 )
+_GP_ESCAPES: Final[dict[int, str]] = str.maketrans({"\\": "\\\\", "'": "\\'"})
+# A whole line holding one BENCH_TABLE marker, optionally padded with whitespace.
+_README_MARKER_RE: Final[re.Pattern[str]] = re.compile(r"^[^\S\n]*(?P<marker><!-- BENCH_TABLE:[^\n]*?-->)[^\S\n]*(?:\n|\Z)", re.MULTILINE)
 
 
+@functools.cache
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
 def _dim_from_group_dir(name: str) -> int | None:
-    match = re.fullmatch(r"d(\d+)", name)
-    if match is None:
+    # isdecimal() admits only Unicode decimal digits, every one of which int() accepts.
+    digits = name[1:]
+    if name[:1] != "d" or not digits.isdecimal():
         return None
-    return int(match.group(1))
+    return int(digits)
 
 
 def _is_parsed_object(value: object) -> TypeGuard[ParsedObject]:
@@ -295,22 +316,43 @@ def _require_parsed_object(value: object, context: str) -> ParsedObject:
 
 
 def _discover_dims(criterion_dir: Path) -> list[int]:
-    dims: list[int] = []
-    for child in criterion_dir.iterdir():
-        if not child.is_dir():
-            continue
-        d = _dim_from_group_dir(child.name)
-        if d is None:
-            continue
-        dims.append(d)
-    return sorted(dims)
+    # DirEntry answers is_dir() from the cached directory listing, without a stat per child.
+    with os.scandir(criterion_dir) as entries:
+        return sorted(dim for entry in entries if (dim := _dim_from_group_dir(entry.name)) is not None and entry.is_dir())
 
 
-def _read_cargo_package_version(cargo_toml: Path) -> str | None:
-    if not cargo_toml.exists():
-        return None
+def _bench_dirs(group_dir: Path) -> set[str]:
+    """Return the benchmark directory names in one dimension group (empty if absent)."""
+    try:
+        with os.scandir(group_dir) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except _MISSING_FILE_ERRORS:
+        return set()
+
+
+def _is_missing_file(exc: BaseException | None) -> bool:
+    return isinstance(exc, _MISSING_FILE_ERRORS)
+
+
+def _load_cargo(cargo_toml: Path) -> ParsedObject:
+    """Parse a Cargo manifest once; a missing manifest yields an empty table."""
+    try:
+        stat = cargo_toml.stat()
+    except _MISSING_FILE_ERRORS:
+        return {}
+    return _parse_cargo(cargo_toml, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.cache
+def _parse_cargo(cargo_toml: Path, _mtime_ns: int, _size: int) -> ParsedObject:
+    # Keyed on the file's stat signature so an edited manifest is never served stale;
+    # callers only read the returned table.
+    with cargo_toml.open("rb") as f:
+        data: object = tomllib.load(f)
+    return _require_parsed_object(data, str(cargo_toml))
+
 
-    data = _read_cargo_toml(cargo_toml)
+def _cargo_package_version(data: ParsedObject) -> str | None:
     package = data.get("package")
     if _is_parsed_object(package):
         version = package.get("version")
@@ -319,11 +361,7 @@ def _read_cargo_package_version(cargo_toml: Path) -> str | None:
     return None
 
 
-def _read_cargo_dependency_versions(cargo_toml: Path, names: set[str]) -> dict[str, str]:
-    if not cargo_toml.exists():
-        return {}
-
-    data = _read_cargo_toml(cargo_toml)
+def _cargo_dependency_versions(data: ParsedObject, names: set[str]) -> dict[str, str]:
     versions: dict[str, str] = {}
     for section in ("dependencies", "dev-dependencies", "build-dependencies"):
         table = data.get(section)
@@ -341,15 +379,10 @@ def _read_cargo_dependency_versions(cargo_toml: Path, names: set[str]) -> dict[s
     return versions
 
 
-def _read_cargo_toml(cargo_toml: Path) -> ParsedObject:
-    data: object = tomllib.loads(cargo_toml.read_text(encoding="utf-8"))
-    return _require_parsed_object(data, str(cargo_toml))
-
-
 def _detect_versions(root: Path) -> dict[str, str]:
-    cargo_toml = root / "Cargo.toml"
-    package_version = _read_cargo_package_version(cargo_toml) or "unknown"
-    dep_versions = _read_cargo_dependency_versions(cargo_toml, {"nalgebra", "faer"})
+    cargo = _load_cargo(root / "Cargo.toml")
+    package_version = _cargo_package_version(cargo) or "unknown"
+    dep_versions = _cargo_dependency_versions(cargo, {"nalgebra", "faer"})
 
     return {
         "la-stack": package_version,
@@ -394,7 +427,8 @@ def _read_estimate(estimates_json: Path, stat: str) -> tuple[float, float, float
 
 def _read_json_object(path: Path) -> ParsedObject:
     try:
-        data: object = json.loads(path.read_text(encoding="utf-8"))
+        # json.loads detects the encoding of raw bytes itself, so skip the str decode pass.
+        data: object = json.loads(path.read_bytes())
     except json.JSONDecodeError as err:
         msg = f"malformed Criterion estimates JSON in {path}: {err}"
         raise ValueError(msg) from err
@@ -439,10 +473,10 @@ def _require_confidence_interval(lo: float, hi: float, context: str) -> None:
 
 def _write_csv(out_csv: Path, rows: list[Row]) -> None:
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-    with out_csv.open("w", encoding="utf-8") as f:
-        f.write("D,la_stack,la_lo,la_hi,nalgebra,na_lo,na_hi,faer,fa_lo,fa_hi\n")
-        for row in rows:
-            f.write(f"{row.dim},{row.la_time},{row.la_lo},{row.la_hi},{row.na_time},{row.na_lo},{row.na_hi},{row.fa_time},{row.fa_lo},{row.fa_hi}\n")
+    with out_csv.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(_CSV_HEADER)
+        writer.writerows(map(_CSV_ROW_VALUES, rows))
 
 
 def _pct_reduction(baseline: float, value: float) -> str:
@@ -453,64 +487,82 @@ def _pct_reduction(baseline: float, value: float) -> str:
     return f"{pct:+.1f}%"
 
 
-def _markdown_table(rows: list[Row], stat: str) -> str:
-    lines = [
-        f"| D | la-stack {stat} (ns) | nalgebra {stat} (ns) | faer {stat} (ns) | reduction vs nalgebra (point est.) | reduction vs faer (point est.) |",
-        "|---:|--------------------:|--------------------:|----------------:|---------------------:|----------------:|",
-    ]
+@functools.cache
+def _markdown_table_header(stat: str) -> str:
+    return (
+        f"| D | la-stack {stat} (ns) | nalgebra {stat} (ns) | faer {stat} (ns) | reduction vs nalgebra (point est.) | reduction vs faer (point est.) |\n"
+        "|---:|--------------------:|--------------------:|----------------:|---------------------:|----------------:|"
+    )
+
+
+def _markdown_row(row: Row) -> str:
+    dim, la_time, na_time, fa_time = _MARKDOWN_ROW_TIMES(row)
+    return _MARKDOWN_ROW_FORMAT(dim, la_time, na_time, fa_time, _pct_reduction(na_time, la_time), _pct_reduction(fa_time, la_time))
 
-    for row in rows:
-        pct_vs_na = _pct_reduction(row.na_time, row.la_time)
-        pct_vs_fa = _pct_reduction(row.fa_time, row.la_time)
-        lines.append(f"| {row.dim} | {row.la_time:,.3f} | {row.na_time:,.3f} | {row.fa_time:,.3f} | {pct_vs_na} | {pct_vs_fa} |")
 
-    return "\n".join(lines)
+def _markdown_table(rows: list[Row], stat: str) -> str:
+    return "\n".join((_markdown_table_header(stat), *map(_markdown_row, rows)))
 
 
+@functools.cache
 def _readme_table_markers(metric: str, stat: str, sample: str) -> tuple[str, str]:
     tag = f"BENCH_TABLE:{metric}:{stat}:{sample}"
     return (f"<!-- {tag}:BEGIN -->", f"<!-- {tag}:END -->")
 
 
+def _marker_line_spans(text: str, marker_begin: str, marker_end: str) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """Return `(start, end)` offsets of every line consisting solely of each marker.
+
+    `end` includes the line's newline. All BENCH_TABLE marker lines are collected in one
+    `_README_MARKER_RE` pass and then matched against the requested markers.
+    """
+    begin_spans: list[tuple[int, int]] = []
+    end_spans: list[tuple[int, int]] = []
+    for match in _README_MARKER_RE.finditer(text):
+        marker = match.group("marker")
+        if marker == marker_begin:
+            begin_spans.append(match.span())
+        elif marker == marker_end:
+            end_spans.append(match.span())
+    return (begin_spans, end_spans)
+
+
 def _update_readme_table(readme_path: Path, marker_begin: str, marker_end: str, table_md: str) -> bool:
-    lines = readme_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    text = readme_path.read_text(encoding="utf-8")
 
-    begin_indices = [i for i, line in enumerate(lines) if line.strip() == marker_begin]
-    end_indices = [i for i, line in enumerate(lines) if line.strip() == marker_end]
+    begin_spans, end_spans = _marker_line_spans(text, marker_begin, marker_end)
 
-    if len(begin_indices) != 1 or len(end_indices) != 1:
-        msg = f"README markers not found or not unique (begin={len(begin_indices)}, end={len(end_indices)})."
+    if len(begin_spans) != 1 or len(end_spans) != 1:
+        msg = f"README markers not found or not unique (begin={len(begin_spans)}, end={len(end_spans)})."
         raise MarkerNotFoundError(msg)
 
-    begin_idx = begin_indices[0]
-    end_idx = end_indices[0]
-    if begin_idx >= end_idx:
+    begin_start, body_start = begin_spans[0]
+    body_end, _end_stop = end_spans[0]
+    if begin_start >= body_end:
         msg = "README markers are out of order."
         raise MarkerOrderError(msg)
 
-    table_lines = ["\n", *[line + "\n" for line in table_md.strip("\n").splitlines()], "\n"]
-    new_lines = [
-        *lines[: begin_idx + 1],
-        *table_lines,
-        *lines[end_idx:],
-    ]
+    table_body = "".join(line + "\n" for line in table_md.strip("\n").splitlines())
+    block = f"\n{table_body}\n"
 
-    if new_lines == lines:
+    # Only the region between the markers can change; compare it in place so an
+    # up-to-date README is detected without assembling the full document.
+    if text[body_start:body_end] == block:
         return False
 
-    readme_path.write_text("".join(new_lines), encoding="utf-8")
+    readme_path.write_text(f"{text[:body_start]}{block}{text[body_end:]}", encoding="utf-8")
     return True
 
 
 def _gp_quote(s: str) -> str:
     # gnuplot supports single-quoted strings; escape backslashes and single quotes.
-    return "'" + s.replace("\\", "\\\\").replace("'", "\\'") + "'"
+    return f"'{s.translate(_GP_ESCAPES)}'"
 
 
 def _render_svg_with_gnuplot(req: PlotRequest) -> None:
     req.out_svg.parent.mkdir(parents=True, exist_ok=True)
 
-    xtics = ", ".join(str(d) for d in req.dims)
+    xtics = ", ".join(str(row.dim) for row in req.rows)
 
     gp_lines = [
         "set terminal svg size 960,540 noenhanced",
@@ -533,12 +585,17 @@ def _render_svg_with_gnuplot(req: PlotRequest) -> None:
     if req.log_y:
         gp_lines.append("set logscale y 10")
 
+    # Inline datablock in CSV column order, so gnuplot never re-reads the CSV file.
+    gp_lines.append("$DATA << EOD")
+    gp_lines.extend(",".join(map(repr, _CSV_ROW_VALUES(row))) for row in req.rows)
+    gp_lines.append("EOD")
+
     gp_lines.extend(
         [
             "plot \\",
-            f"  {_gp_quote(str(req.csv_path))} using 1:2:3:4 with yerrorlines ls 1 title {_gp_quote(req.la_label)}, \\",
-            f"  {_gp_quote(str(req.csv_path))} using 1:5:6:7 with yerrorlines ls 2 title {_gp_quote(req.na_label)}, \\",
-            f"  {_gp_quote(str(req.csv_path))} using 1:8:9:10 with yerrorlines ls 3 title {_gp_quote(req.fa_label)}",
+            f"  $DATA using 1:2:3:4 with yerrorlines ls 1 title {_gp_quote(req.la_label)}, \\",
+            f"  $DATA using 1:5:6:7 with yerrorlines ls 2 title {_gp_quote(req.na_label)}, \\",
+            f"  $DATA using 1:8:9:10 with yerrorlines ls 3 title {_gp_quote(req.fa_label)}",
         ]
     )
 
@@ -555,8 +612,8 @@ def _parse_args(argv: list[str]) -> PlotCliArgs:
     parser.add_argument(
         "--metric",
         default="lu_solve",
-        choices=sorted(METRICS.keys()),
-        help="Which vs_linalg metric to plot.",
+        choices=[*sorted(METRICS.keys()), ALL_METRICS],
+        help="Which vs_linalg metric to plot; 'all' renders every metric from one scan (exploratory only).",
     )
     parser.add_argument(
         "--stat",
@@ -658,42 +715,63 @@ def _resolve_under_root(root: Path, arg: str) -> Path:
 
 def _resolve_output_paths(root: Path, metric: str, stat: str, out_svg: str | None, out_csv: str | None) -> tuple[Path, Path]:
     svg = Path(out_svg) if out_svg is not None else Path(f"docs/assets/bench/vs_linalg_{metric}_{stat}.svg")
-    csv = Path(out_csv) if out_csv is not None else Path(f"docs/assets/bench/vs_linalg_{metric}_{stat}.csv")
+    csv_path = Path(out_csv) if out_csv is not None else Path(f"docs/assets/bench/vs_linalg_{metric}_{stat}.csv")
 
     if not svg.is_absolute():
         svg = root / svg
-    if not csv.is_absolute():
-        csv = root / csv
+    if not csv_path.is_absolute():
+        csv_path = root / csv_path
+
+    return (svg, csv_path)
+
+
+def _collect_metric_rows(
+    criterion_dir: Path,
+    dims: list[int],
+    metrics: list[Metric],
+    stat: str,
+    sample: str,
+) -> list[tuple[list[Row], list[str]]]:
+    """Collect `(rows, skipped)` for each metric from one shared pass over the groups."""
+    benches = list(dict.fromkeys(bench for metric in metrics for bench in (metric.la_bench, metric.na_bench, metric.fa_bench)))
+
+    # One directory listing per group replaces an exists() probe per estimates file; a
+    # listed benchmark whose sample file is absent is detected by the read itself.
+    files: dict[tuple[int, str], Path] = {}
+    for d in dims:
+        group_dir = criterion_dir / f"d{d}"
+        present = _bench_dirs(group_dir)
+        for bench in benches:
+            if bench in present:
+                files[(d, bench)] = group_dir / bench / sample / "estimates.json"
+
+    # Reads are I/O bound and independent, so they run concurrently; results are still
+    # consumed in dimension order, so the first invalid file is the one reported.
+    reads: dict[tuple[int, str], Future[tuple[float, float, float]]] = {}
+    if files:
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(files))) as pool:
+            reads = {key: pool.submit(_read_estimate, path, stat) for key, path in files.items()}
 
-    return (svg, csv)
+    return [_assemble_rows(dims, metric, reads) for metric in metrics]
 
 
-def _collect_rows(criterion_dir: Path, dims: list[int], metric: Metric, stat: str, sample: str) -> tuple[list[Row], list[str]]:
+def _assemble_rows(
+    dims: list[int],
+    metric: Metric,
+    reads: dict[tuple[int, str], Future[tuple[float, float, float]]],
+) -> tuple[list[Row], list[str]]:
     rows: list[Row] = []
     skipped: list[str] = []
+    benches = (metric.la_bench, metric.na_bench, metric.fa_bench)
 
     for d in dims:
-        group_dir = criterion_dir / f"d{d}"
-        la_est = group_dir / metric.la_bench / sample / "estimates.json"
-        na_est = group_dir / metric.na_bench / sample / "estimates.json"
-        fa_est = group_dir / metric.fa_bench / sample / "estimates.json"
-
-        missing = [
-            bench
-            for bench, path in (
-                (metric.la_bench, la_est),
-                (metric.na_bench, na_est),
-                (metric.fa_bench, fa_est),
-            )
-            if not path.exists()
-        ]
+        dim_reads = [reads.get((d, bench)) for bench in benches]
+        missing = [bench for bench, read in zip(benches, dim_reads, strict=True) if read is None or _is_missing_file(read.exception())]
         if missing:
             skipped.append(f"d{d} (missing {', '.join(missing)})")
             continue
 
-        la, la_lo, la_hi = _read_estimate(la_est, stat)
-        na, na_lo, na_hi = _read_estimate(na_est, stat)
-        fa, fa_lo, fa_hi = _read_estimate(fa_est, stat)
+        (la, la_lo, la_hi), (na, na_lo, na_hi), (fa, fa_lo, fa_hi) = (read.result() for read in dim_reads if read is not None)
         rows.append(
             Row(
                 dim=d,
@@ -912,14 +990,8 @@ def _rustc_version(root: Path) -> str:
     return value or "unavailable"
 
 
-def _capture_provenance(
-    root: Path,
-    *,
-    args: PlotCliArgs,
-    dims: list[int],
-    measurement_recorded: bool,
-) -> dict[str, object]:
-    """Capture deterministic provenance for CSV/SVG and README publication."""
+def _capture_environment(root: Path) -> dict[str, object]:
+    """Capture the checkout and host state shared by every artifact of one run."""
     harness_sha256, missing_harness_files = _provenance_harness_digest(root)
     cargo_lock = root / "Cargo.lock"
     cargo_lock_sha256 = hashlib.sha256(cargo_lock.read_bytes()).hexdigest() if cargo_lock.is_file() else "unavailable"
@@ -927,7 +999,7 @@ def _capture_provenance(
     os_description = " ".join(part for part in (platform.system(), platform.release(), platform.machine()) if part).strip() or "unavailable"
     git_clean, git_status_sha256 = _git_status_metadata(root)
     source_state_sha256, source_missing = _source_state_digest(root)
-    environment: dict[str, object] = {
+    return {
         "cargo_lock_sha256": cargo_lock_sha256,
         "commit": _git_value(root, ["--no-pager", "rev-parse", "HEAD"]),
         "cpu": cpu,
@@ -940,6 +1012,19 @@ def _capture_provenance(
         "source_missing": source_missing,
         "source_state_sha256": source_state_sha256,
     }
+
+
+def _capture_provenance(
+    root: Path,
+    *,
+    args: PlotCliArgs,
+    dims: list[int],
+    measurement_recorded: bool,
+    environment: dict[str, object] | None = None,
+) -> dict[str, object]:
+    """Capture deterministic provenance for CSV/SVG and README publication."""
+    if environment is None:
+        environment = _capture_environment(root)
     measurement: dict[str, object]
     if measurement_recorded:
         measurement = {"status": "recorded", **environment}
@@ -948,7 +1033,7 @@ def _capture_provenance(
             "reason": "the exploratory renderer did not run the benchmark command that produced these Criterion samples",
             "status": "unavailable",
         }
-    criterion_version = _read_cargo_dependency_versions(root / "Cargo.toml", {"criterion"}).get("criterion", "unavailable")
+    criterion_version = _cargo_dependency_versions(_load_cargo(root / "Cargo.toml"), {"criterion"}).get("criterion", "unavailable")
     return {
         "artifact": "README vs_linalg dimension plot" if args.update_readme else "exploratory vs_linalg dimension plot",
         "criterion": {
@@ -975,6 +1060,19 @@ def _write_provenance(path: Path, provenance: dict[str, object]) -> None:
     path.write_text(json.dumps(provenance, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
+def _validate_metric_selection(args: PlotCliArgs) -> int:
+    """Reject options that cannot apply to every metric of an `--metric all` run."""
+    if args.metric != ALL_METRICS:
+        return 0
+    if args.update_readme:
+        print(f"--metric {ALL_METRICS} is exploratory-only and cannot be combined with --update-readme", file=sys.stderr)
+        return 2
+    if args.out is not None or args.csv is not None:
+        print(f"--metric {ALL_METRICS} writes each metric to its default CSV/SVG path; --out and --csv are not supported", file=sys.stderr)
+        return 2
+    return 0
+
+
 def _validate_readme_target(root: Path, args: PlotCliArgs) -> int:  # noqa: C901, PLR0911
     """Validate publication-only CLI invariants and README markers before timing."""
     if not args.update_readme:
@@ -1009,18 +1107,15 @@ def _validate_readme_target(root: Path, args: PlotCliArgs) -> int:  # noqa: C901
             return 2
     marker_begin, marker_end = _readme_table_markers(args.metric, args.stat, args.sample)
     try:
-        lines = readme_path.read_text(encoding="utf-8").splitlines()
+        text = readme_path.read_text(encoding="utf-8")
     except OSError as exc:
         print(str(exc), file=sys.stderr)
         return 2
-    begin_count = sum(line.strip() == marker_begin for line in lines)
-    end_count = sum(line.strip() == marker_end for line in lines)
-    if begin_count != 1 or end_count != 1:
-        print(f"README markers not found or not unique (begin={begin_count}, end={end_count}).", file=sys.stderr)
+    begin_spans, end_spans = _marker_line_spans(text, marker_begin, marker_end)
+    if len(begin_spans) != 1 or len(end_spans) != 1:
+        print(f"README markers not found or not unique (begin={len(begin_spans)}, end={len(end_spans)}).", file=sys.stderr)
         return 2
-    begin_idx = next(index for index, line in enumerate(lines) if line.strip() == marker_begin)
-    end_idx = next(index for index, line in enumerate(lines) if line.strip() == marker_end)
-    if begin_idx >= end_idx:
+    if begin_spans[0][0] >= end_spans[0][0]:
         print("README markers are out of order.", file=sys.stderr)
         return 2
     return 0
@@ -1114,7 +1209,7 @@ def _stage_and_publish_outputs(  # noqa: PLR0913
                 out_svg=staged_svg,
                 title=req.title,
                 stat=req.stat,
-                dims=req.dims,
+                rows=req.rows,
                 la_label=req.la_label,
                 na_label=req.na_label,
                 fa_label=req.fa_label,
@@ -1200,54 +1295,28 @@ def _maybe_render_plot(args: _RenderArgs, req: PlotRequest, skipped: list[str])
     return 0
 
 
-def main(argv: list[str] | None = None) -> int:  # noqa: C901, PLR0911, PLR0912, PLR0915
-    """Generate benchmark CSV and optional SVG or README output."""
-    args = _parse_args(sys.argv[1:] if argv is None else argv)
-
-    root = _repo_root()
-
-    rc = _validate_readme_target(root, args)
-    if rc != 0:
-        return rc
-    if args.update_readme:
-        try:
-            _run_publication_benchmarks(root, args.metric)
-        except (FileNotFoundError, RuntimeError) as exc:
-            print(str(exc), file=sys.stderr)
-            return 2
-
-    versions = _detect_versions(root)
-    _print_versions(versions)
-
-    la_label = _format_legend_label("la-stack", versions.get("la-stack", "unknown"))
-    na_label = _format_legend_label("nalgebra", versions.get("nalgebra", "unknown"))
-    fa_label = _format_legend_label("faer", versions.get("faer", "unknown"))
-
-    criterion_dir = _resolve_under_root(root, args.criterion_dir)
-
-    discovered_dims = _discover_dims(criterion_dir) if criterion_dir.exists() else []
-    dims = discovered_dims if args.allow_partial else list(CANONICAL_DIMS)
-    if not args.allow_partial and not discovered_dims:
-        dims = []
-    if not dims:
-        print(
-            f"No Criterion results found under {criterion_dir}.\n\nRun benchmarks first, e.g.:\n  cargo bench --bench vs_linalg\n",
-            file=sys.stderr,
-        )
-        return 2
+def _publish_metric(  # noqa: PLR0913
+    root: Path,
+    args: PlotCliArgs,
+    *,
+    criterion_dir: Path,
+    rows: list[Row],
+    skipped: list[str],
+    labels: tuple[str, str, str],
+    environment: dict[str, object] | None,
+    batch: bool,
+) -> int:
+    """Validate one metric's coverage and provenance, then stage and publish its outputs.
 
+    Batch runs name the metric in their diagnostics; single-metric runs keep the original wording.
+    """
     metric = METRICS[args.metric]
-
     out_svg, out_csv = _resolve_output_paths(root, args.metric, args.stat, args.out, args.csv)
 
-    try:
-        rows, skipped = _collect_rows(criterion_dir, dims, metric, args.stat, args.sample)
-    except (OSError, KeyError, TypeError, ValueError) as exc:
-        print(f"Invalid Criterion estimate data: {exc}", file=sys.stderr)
-        return 2
     if not rows:
+        selection = f"metric {args.metric} ({args.stat})" if batch else "the selected metric/stat"
         print(
-            "No benchmark results found to plot for the selected metric/stat.\n"
+            f"No benchmark results found to plot for {selection}.\n"
             f"Expected files like:\n  {criterion_dir}/d32/{metric.la_bench}/{args.sample}/estimates.json\n",
             file=sys.stderr,
         )
@@ -1257,7 +1326,7 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901, PLR0911, PLR0912,
 
     if not args.allow_partial and skipped:
         print(
-            "Canonical benchmark coverage is incomplete; no CSV, SVG, provenance, or README file was written.",
+            f"Canonical benchmark coverage{f' for {args.metric}' if batch else ''} is incomplete; no CSV, SVG, provenance, or README file was written.",
             file=sys.stderr,
         )
         print("Required dimensions: " + ", ".join(f"D={dim}" for dim in CANONICAL_DIMS), file=sys.stderr)
@@ -1270,6 +1339,7 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901, PLR0911, PLR0912,
         args=args,
         dims=dims_present,
         measurement_recorded=args.update_readme,
+        environment=environment,
     )
     publication = provenance.get("publication")
     if not isinstance(publication, dict):
@@ -1299,10 +1369,10 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901, PLR0911, PLR0912,
         out_svg=out_svg,
         title=title,
         stat=args.stat,
-        dims=tuple(dims_present),
-        la_label=la_label,
-        na_label=na_label,
-        fa_label=fa_label,
+        rows=tuple(rows),
+        la_label=labels[0],
+        na_label=labels[1],
+        fa_label=labels[2],
         log_y=args.log_y,
     )
 
@@ -1316,5 +1386,75 @@ def main(argv: list[str] | None = None) -> int:  # noqa: C901, PLR0911, PLR0912,
     )
 
 
+def main(argv: list[str] | None = None) -> int:
+    """Generate benchmark CSV and optional SVG or README output."""
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    root = _repo_root()
+
+    rc = _validate_metric_selection(args)
+    if rc != 0:
+        return rc
+    rc = _validate_readme_target(root, args)
+    if rc != 0:
+        return rc
+    if args.update_readme:
+        try:
+            _run_publication_benchmarks(root, args.metric)
+        except (FileNotFoundError, RuntimeError) as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
+
+    versions = _detect_versions(root)
+    _print_versions(versions)
+
+    labels = (
+        _format_legend_label("la-stack", versions.get("la-stack", "unknown")),
+        _format_legend_label("nalgebra", versions.get("nalgebra", "unknown")),
+        _format_legend_label("faer", versions.get("faer", "unknown")),
+    )
+
+    criterion_dir = _resolve_under_root(root, args.criterion_dir)
+
+    discovered_dims = _discover_dims(criterion_dir) if criterion_dir.exists() else []
+    dims = discovered_dims if args.allow_partial else list(CANONICAL_DIMS)
+    if not args.allow_partial and not discovered_dims:
+        dims = []
+    if not dims:
+        print(
+            f"No Criterion results found under {criterion_dir}.\n\nRun benchmarks first, e.g.:\n  cargo bench --bench vs_linalg\n",
+            file=sys.stderr,
+        )
+        return 2
+
+    metric_names = sorted(METRICS) if args.metric == ALL_METRICS else [args.metric]
+
+    try:
+        collected = _collect_metric_rows(criterion_dir, dims, [METRICS[name] for name in metric_names], args.stat, args.sample)
+    except (OSError, KeyError, TypeError, ValueError) as exc:
+        print(f"Invalid Criterion estimate data: {exc}", file=sys.stderr)
+        return 2
+
+    # Checkout and host state is identical for every metric, so a batch captures it once.
+    environment = _capture_environment(root) if args.metric == ALL_METRICS else None
+
+    rc = 0
+    for name, (rows, skipped) in zip(metric_names, collected, strict=True):
+        rc = max(
+            rc,
+            _publish_metric(
+                root,
+                replace(args, metric=name),
+                criterion_dir=criterion_dir,
+                rows=rows,
+                skipped=skipped,
+                labels=labels,
+                environment=environment,
+                batch=args.metric == ALL_METRICS,
+            ),
+        )
+    return rc
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
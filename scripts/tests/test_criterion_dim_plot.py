@@ -7,7 +7,7 @@ import json
 import re
 import subprocess
 import tomllib
-from dataclasses import replace
+from dataclasses import FrozenInstanceError, replace
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
 
@@ -19,6 +19,13 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 _OVERFLOWING_TIMING = 10**400
+_ESTIMATES_TEMPLATE = b'{"median":{"point_estimate":%r,"confidence_interval":{"lower_bound":%r,"upper_bound":%r}}}'
+
+
+def _write_estimates(path: Path, median: float) -> None:
+    """Write a minimal Criterion estimates file with a +/-10% median confidence interval."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_ESTIMATES_TEMPLATE % (median, median * 0.9, median * 1.1))
 
 
 def _toml_dependency_version(data: dict[str, object], name: str) -> str | None:
@@ -26,15 +33,13 @@ def _toml_dependency_version(data: dict[str, object], name: str) -> str | None:
         table = data.get(section)
         if not isinstance(table, dict):
             continue
-        table_dict = cast("dict[str, object]", table)
-        value = table_dict.get(name)
+        value = table.get(name)
         if value is None:
             continue
         if isinstance(value, str):
             return value
         if isinstance(value, dict):
-            value_dict = cast("dict[str, object]", value)
-            version = value_dict.get("version")
+            version = value.get("version")
             if isinstance(version, str):
                 return version
     return None
@@ -44,7 +49,8 @@ def test_detect_versions_matches_cargo_toml() -> None:
     root = criterion_dim_plot._repo_root()
     cargo_toml = root / "Cargo.toml"
 
-    data = tomllib.loads(cargo_toml.read_text(encoding="utf-8"))
+    with cargo_toml.open("rb") as f:
+        data = tomllib.load(f)
 
     package_version: str | None = None
     package = data.get("package")
@@ -68,6 +74,7 @@ def test_readme_table_markers_are_stable() -> None:
     begin, end = criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
     assert begin == "<!-- BENCH_TABLE:lu_solve:median:new:BEGIN -->"
     assert end == "<!-- BENCH_TABLE:lu_solve:median:new:END -->"
+    assert criterion_dim_plot._readme_table_markers("lu_solve", "median", "new") is criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
 
 
 def test_markdown_table_formats_values_and_pct() -> None:
@@ -106,6 +113,9 @@ def test_markdown_table_formats_values_and_pct() -> None:
     assert "| 2 | 50.000 | 100.000 | 200.000 | +50.0% | +75.0% |" in table
     # thousand separator and sign
     assert "| 64 | 1,000.000 | 900.000 | 800.000 | -11.1% | -25.0% |" in table
+    assert table.splitlines()[2:] == [criterion_dim_plot._markdown_row(row) for row in rows]
+    assert not table.endswith("\n")
+    assert criterion_dim_plot._markdown_table([], stat="median") == "\n".join(table.splitlines()[:2])
 
 
 @pytest.mark.parametrize(
@@ -142,6 +152,14 @@ def test_row_rejects_zero_peer_time_before_markdown_rendering() -> None:
         )
 
 
+def test_row_is_slotted_and_immutable() -> None:
+    row = criterion_dim_plot.Row(dim=2, la_time=1.0, la_lo=0.9, la_hi=1.1, na_time=2.0, na_lo=1.9, na_hi=2.1, fa_time=3.0, fa_lo=2.9, fa_hi=3.1)
+
+    assert not hasattr(row, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        row.la_time = 5.0
+
+
 def test_gp_quote_escapes_backslashes_and_quotes() -> None:
     assert criterion_dim_plot._gp_quote("plain") == "'plain'"
     assert criterion_dim_plot._gp_quote("a'b") == "'a\\'b'"
@@ -149,6 +167,45 @@ def test_gp_quote_escapes_backslashes_and_quotes() -> None:
     assert criterion_dim_plot._gp_quote("a\\'b") == "'a\\\\\\'b'"
 
 
+def test_render_svg_with_gnuplot_inlines_rows_as_datablock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    scripts: list[str] = []
+
+    def fake_run_safe(command: str, args: list[str], **kwargs: object) -> SimpleNamespace:
+        assert (command, args) == ("gnuplot", [])
+        scripts.append(cast("str", kwargs["input"]))
+        return SimpleNamespace(stdout="")
+
+    monkeypatch.setattr(criterion_dim_plot, "run_safe_command", fake_run_safe)
+    req = criterion_dim_plot.PlotRequest(
+        csv_path=tmp_path / "missing.csv",
+        out_svg=tmp_path / "out.svg",
+        title="t",
+        stat="median",
+        rows=(
+            criterion_dim_plot.Row(2, 1.0, 0.9, 1.1, 2.0, 1.9, 2.1, 3.0, 2.9, 3.1),
+            criterion_dim_plot.Row(64, 1e16, 9e15, 1.5e16, 2.0, 1.9, 2.1, 3.0, 2.9, 3.1),
+        ),
+        la_label="la",
+        na_label="na",
+        fa_label="fa",
+        log_y=False,
+    )
+
+    criterion_dim_plot._render_svg_with_gnuplot(req)
+
+    (script,) = scripts
+    lines = script.splitlines()
+    assert "set xtics (2, 64)" in lines
+    start = lines.index("$DATA << EOD")
+    assert lines[start + 1 : start + 4] == [
+        "2,1.0,0.9,1.1,2.0,1.9,2.1,3.0,2.9,3.1",
+        "64,1e+16,9000000000000000.0,1.5e+16,2.0,1.9,2.1,3.0,2.9,3.1",
+        "EOD",
+    ]
+    assert "missing.csv" not in script
+    assert "  $DATA using 1:8:9:10 with yerrorlines ls 3 title 'fa'" in lines
+
+
 def test_maybe_render_plot_handles_gnuplot_failure(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
     # Simulate gnuplot existing but failing to run (CalledProcessError).
     def boom(_req: object) -> None:
@@ -162,7 +219,7 @@ def test_maybe_render_plot_handles_gnuplot_failure(capsys: pytest.CaptureFixture
         out_svg=criterion_dim_plot.Path("out.svg"),
         title="t",
         stat="median",
-        dims=(2,),
+        rows=(criterion_dim_plot.Row(2, 1.0, 0.9, 1.1, 2.0, 1.9, 2.1, 3.0, 2.9, 3.1),),
         la_label="la-stack v0.1.2",
         na_label="nalgebra v0.34.1",
         fa_label="faer v0.24.0",
@@ -203,6 +260,31 @@ def test_update_readme_table_replaces_only_between_markers(tmp_path: Path) -> No
     assert changed_again is False
 
 
+def test_update_readme_table_ignores_inline_marker_mentions(tmp_path: Path) -> None:
+    marker_begin, marker_end = criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
+
+    readme = tmp_path / "README.md"
+    readme.write_text(
+        f"See `{marker_begin}` and `{marker_end}`.\n  {marker_begin}  \nold\n\t{marker_end}\nafter",
+        encoding="utf-8",
+    )
+
+    changed = criterion_dim_plot._update_readme_table(readme, marker_begin, marker_end, "| a |")
+    assert changed is True
+    assert readme.read_text(encoding="utf-8") == f"See `{marker_begin}` and `{marker_end}`.\n  {marker_begin}  \n\n| a |\n\n\t{marker_end}\nafter"
+
+
+def test_update_readme_table_leaves_other_tables_untouched(tmp_path: Path) -> None:
+    marker_begin, marker_end = criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
+    other_begin, other_end = criterion_dim_plot._readme_table_markers("dot", "median", "new")
+
+    readme = tmp_path / "README.md"
+    readme.write_text(f"{other_begin}\nkeep\n{other_end}\n{marker_begin}\nold\n{marker_end}\n", encoding="utf-8")
+
+    assert criterion_dim_plot._update_readme_table(readme, marker_begin, marker_end, "| a |") is True
+    assert readme.read_text(encoding="utf-8") == f"{other_begin}\nkeep\n{other_end}\n{marker_begin}\n\n| a |\n\n{marker_end}\n"
+
+
 def test_update_readme_table_errors_on_missing_markers(tmp_path: Path) -> None:
     readme = tmp_path / "README.md"
     readme.write_text("# Title\n", encoding="utf-8")
@@ -298,6 +380,34 @@ def test_readme_publication_rejects_no_plot_before_timing(
     assert "--no-plot is exploratory-only" in capsys.readouterr().err
 
 
+@pytest.mark.parametrize(
+    ("template", "message"),
+    [
+        ("{begin}\nold\n", "not found or not unique (begin=1, end=0)"),
+        ("{begin}\n{begin}\nold\n{end}\n", "not found or not unique (begin=2, end=1)"),
+        ("{end}\nold\n{begin}\n", "out of order"),
+        ("See `{begin}`.\n  {begin}\nold\n{end}  \n", None),
+    ],
+)
+def test_readme_publication_validates_whole_line_markers_before_timing(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    template: str,
+    message: str | None,
+) -> None:
+    begin, end = criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
+    fixture = tmp_path / "README.fixture.md"
+    fixture.write_text(template.format(begin=begin, end=end), encoding="utf-8")
+
+    rc = criterion_dim_plot._validate_readme_target(tmp_path, replace(_publication_args(), readme=str(fixture)))
+
+    if message is None:
+        assert rc == 0
+    else:
+        assert rc == 2
+        assert message in capsys.readouterr().err
+
+
 def test_fixture_readme_may_use_custom_asset_destinations(tmp_path: Path) -> None:
     begin, end = criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
     fixture = tmp_path / "README.fixture.md"
@@ -324,26 +434,12 @@ def test_main_update_readme_happy_path(  # noqa: PLR0915
     # Create a minimal Criterion directory structure for lu_solve.
     criterion_dir = tmp_path / "target" / "criterion"
 
-    def write_estimates(path: Path, median: float) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(
-                {
-                    "median": {
-                        "point_estimate": median,
-                        "confidence_interval": {"lower_bound": median * 0.9, "upper_bound": median * 1.1},
-                    }
-                }
-            ),
-            encoding="utf-8",
-        )
-
     for d in criterion_dim_plot.CANONICAL_DIMS:
         la, na, fa = (float(d * 5), float(d * 10), float(d * 20))
         base = criterion_dir / f"d{d}"
-        write_estimates(base / "la_stack_lu_solve" / "new" / "estimates.json", la)
-        write_estimates(base / "nalgebra_lu_solve" / "new" / "estimates.json", na)
-        write_estimates(base / "faer_lu_solve" / "new" / "estimates.json", fa)
+        _write_estimates(base / "la_stack_lu_solve" / "new" / "estimates.json", la)
+        _write_estimates(base / "nalgebra_lu_solve" / "new" / "estimates.json", na)
+        _write_estimates(base / "faer_lu_solve" / "new" / "estimates.json", fa)
 
     readme = tmp_path / "README.fixture.md"
     marker_begin, marker_end = criterion_dim_plot._readme_table_markers("lu_solve", "median", "new")
@@ -368,9 +464,9 @@ def test_main_update_readme_happy_path(  # noqa: PLR0915
         if command == "cargo":
             for dimension in criterion_dim_plot.CANONICAL_DIMS:
                 base = criterion_dir / f"d{dimension}"
-                write_estimates(base / "la_stack_lu_solve" / "new" / "estimates.json", float(dimension * 5))
-                write_estimates(base / "nalgebra_lu_solve" / "new" / "estimates.json", float(dimension * 10))
-                write_estimates(base / "faer_lu_solve" / "new" / "estimates.json", float(dimension * 20))
+                _write_estimates(base / "la_stack_lu_solve" / "new" / "estimates.json", float(dimension * 5))
+                _write_estimates(base / "nalgebra_lu_solve" / "new" / "estimates.json", float(dimension * 10))
+                _write_estimates(base / "faer_lu_solve" / "new" / "estimates.json", float(dimension * 20))
         return SimpleNamespace(stdout="rustc 1.88.0\n" if command == "rustc" else "")
 
     def fake_run_git(args: list[str], **_kwargs: object) -> SimpleNamespace:
@@ -440,7 +536,7 @@ def test_main_update_readme_happy_path(  # noqa: PLR0915
     assert "| 2 | 10.000 | 20.000 | 40.000 | +50.0% | +75.0% |" in readme_text
     assert "| 64 | 320.000 | 640.000 | 1,280.000 | +50.0% | +75.0% |" in readme_text
 
-    provenance = json.loads(out_csv.with_suffix(".provenance.json").read_text(encoding="utf-8"))
+    provenance = json.loads(out_csv.with_suffix(".provenance.json").read_bytes())
     assert provenance["measurement"]["status"] == "recorded"
     assert provenance["publication"]["correctness_gate"] == "passed"
     assert provenance["publication"]["git_clean"] is False
@@ -453,10 +549,14 @@ def test_dim_parsing_and_discovery(tmp_path: Path) -> None:
     assert criterion_dim_plot._dim_from_group_dir("d10") == 10
     assert criterion_dim_plot._dim_from_group_dir("dx") is None
     assert criterion_dim_plot._dim_from_group_dir("2") is None
+    assert criterion_dim_plot._dim_from_group_dir("d") is None
+    assert criterion_dim_plot._dim_from_group_dir("d+2") is None
+    assert criterion_dim_plot._dim_from_group_dir("d\u00b2") is None
 
     (tmp_path / "d2").mkdir()
     (tmp_path / "d10").mkdir()
     (tmp_path / "not_a_dim").mkdir()
+    (tmp_path / "d3").write_text("not a group directory\n", encoding="utf-8")
     dims = criterion_dim_plot._discover_dims(tmp_path)
     assert dims == [2, 10]
 
@@ -479,10 +579,22 @@ def test_toml_helpers_read_versions(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    assert criterion_dim_plot._read_cargo_package_version(cargo_toml) == "1.2.3"
-    deps = criterion_dim_plot._read_cargo_dependency_versions(cargo_toml, {"nalgebra", "faer"})
+    data = criterion_dim_plot._load_cargo(cargo_toml)
+    assert data == {
+        "package": {"version": "1.2.3"},
+        "dependencies": {"nalgebra": "0.34.0", "faer": {"version": "0.21.4"}},
+        "dev-dependencies": {"serde": "1.0"},
+    }
+    assert criterion_dim_plot._cargo_package_version(data) == "1.2.3"
+    deps = criterion_dim_plot._cargo_dependency_versions(data, {"nalgebra", "faer"})
     assert deps["nalgebra"] == "0.34.0"
     assert deps["faer"] == "0.21.4"
+    assert criterion_dim_plot._load_cargo(tmp_path / "missing.toml") == {}
+
+    # Repeat loads reuse the parse until the manifest changes on disk.
+    assert criterion_dim_plot._load_cargo(cargo_toml) is data
+    cargo_toml.write_text('[package]\nversion = "1.2.40"\n', encoding="utf-8")
+    assert criterion_dim_plot._cargo_package_version(criterion_dim_plot._load_cargo(cargo_toml)) == "1.2.40"
 
 
 def test_format_legend_label() -> None:
@@ -510,6 +622,39 @@ def test_read_estimate_errors_and_success(tmp_path: Path) -> None:
         criterion_dim_plot._read_estimate(estimates, "mean")
 
 
+def test_read_estimate_reads_criterion_layout(tmp_path: Path) -> None:
+    estimates = tmp_path / "estimates.json"
+    # Criterion's serde member order: confidence_interval precedes point_estimate.
+    estimates.write_text(
+        '{"mean":{"confidence_interval":{"confidence_level":0.95,"lower_bound":9.5,"upper_bound":10.5},'
+        '"point_estimate":10.0,"standard_error":0.25},'
+        '"median":{"confidence_interval":{"confidence_level":0.95,"lower_bound":8.25,"upper_bound":9.75},'
+        '"point_estimate":9,"standard_error":0.2},'
+        '"median_abs_dev":{"confidence_interval":{"confidence_level":0.95,"lower_bound":0.1,"upper_bound":0.3},'
+        '"point_estimate":0.2,"standard_error":0.05}}',
+        encoding="utf-8",
+    )
+
+    assert criterion_dim_plot._read_estimate(estimates, "median") == (9.0, 8.25, 9.75)
+    assert criterion_dim_plot._read_estimate(estimates, "mean") == (10.0, 9.5, 10.5)
+
+
+def test_read_estimate_rejects_truncated_criterion_layout(tmp_path: Path) -> None:
+    estimates = tmp_path / "estimates.json"
+    # A partially written file: the requested stat is complete but the document is not.
+    estimates.write_text(
+        '{"mean":{"confidence_interval":{"confidence_level":0.95,"lower_bound":9.5,"upper_bound":10.5},'
+        '"point_estimate":10.0,"standard_error":0.25},'
+        '"median":{"confidence_interval":{"confidence_level":0.95,"lower_bound":8.25,"upper_bound":9.75},'
+        '"point_estimate":9,"standard_error":0.2},'
+        '"median_abs_dev":{"confidence_interval":{"confidence_lev',
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match=re.escape(f"malformed Criterion estimates JSON in {estimates}")):
+        criterion_dim_plot._read_estimate(estimates, "median")
+
+
 def test_read_estimate_malformed_json_names_file(tmp_path: Path) -> None:
     estimates = tmp_path / "estimates.json"
     estimates.write_text("{not json", encoding="utf-8")
@@ -732,11 +877,49 @@ def test_write_csv_and_collect_rows(tmp_path: Path) -> None:
         json.dumps({"median": {"point_estimate": 1.0}}),
         encoding="utf-8",
     )
-    rows2, skipped = criterion_dim_plot._collect_rows(criterion_dir, [2], metric, "median", "new")
+    rows2, skipped = criterion_dim_plot._collect_metric_rows(criterion_dir, [2], [metric], "median", "new")[0]
     assert rows2 == []
     assert skipped == ["d2 (missing nalgebra_lu_solve, faer_lu_solve)"]
 
 
+def test_collect_rows_preserves_dimension_order_and_first_error(tmp_path: Path) -> None:
+    criterion_dir = tmp_path / "criterion"
+    metric = criterion_dim_plot.METRICS["lu_solve"]
+    for d in (16, 2, 5):
+        for scale, bench in enumerate((metric.la_bench, metric.na_bench, metric.fa_bench), start=1):
+            estimates = criterion_dir / f"d{d}" / bench / "new" / "estimates.json"
+            estimates.parent.mkdir(parents=True)
+            point = float(d * scale)
+            estimates.write_text(
+                json.dumps({"median": {"point_estimate": point, "confidence_interval": {"lower_bound": point, "upper_bound": point}}}),
+                encoding="utf-8",
+            )
+
+    rows, skipped = criterion_dim_plot._collect_metric_rows(criterion_dir, [2, 3, 5, 16], [metric], "median", "new")[0]
+    assert [(row.dim, row.la_time, row.na_time, row.fa_time) for row in rows] == [(2, 2.0, 4.0, 6.0), (5, 5.0, 10.0, 15.0), (16, 16.0, 32.0, 48.0)]
+    assert skipped == ["d3 (missing la_stack_lu_solve, nalgebra_lu_solve, faer_lu_solve)"]
+
+    for d in (5, 16):
+        (criterion_dir / f"d{d}" / metric.na_bench / "new" / "estimates.json").write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError, match=re.escape(str(criterion_dir / "d5"))):
+        criterion_dim_plot._collect_metric_rows(criterion_dir, [2, 5, 16], [metric], "median", "new")
+
+
+def test_collect_rows_skips_benchmarks_without_requested_sample(tmp_path: Path) -> None:
+    criterion_dir = tmp_path / "criterion"
+    metric = criterion_dim_plot.METRICS["lu_solve"]
+    d2 = criterion_dir / "d2"
+    # Benchmark directories exist, but only a `base` sample was recorded for faer.
+    for bench in (metric.la_bench, metric.na_bench):
+        (d2 / bench / "new").mkdir(parents=True)
+        (d2 / bench / "new" / "estimates.json").write_text("{not json", encoding="utf-8")
+    (d2 / metric.fa_bench / "base").mkdir(parents=True)
+
+    rows, skipped = criterion_dim_plot._collect_metric_rows(criterion_dir, [2], [metric], "median", "new")[0]
+    assert rows == []
+    assert skipped == ["d2 (missing faer_lu_solve)"]
+
+
 def test_resolve_paths(tmp_path: Path) -> None:
     root = tmp_path
     resolved = criterion_dim_plot._resolve_under_root(root, "foo/bar.csv")
@@ -754,7 +937,7 @@ def test_maybe_render_plot_no_plot_path(capsys: pytest.CaptureFixture[str]) -> N
         out_svg=criterion_dim_plot.Path("out.svg"),
         title="t",
         stat="median",
-        dims=(2,),
+        rows=(criterion_dim_plot.Row(2, 1.0, 0.9, 1.1, 2.0, 1.9, 2.1, 3.0, 2.9, 3.1),),
         la_label="la",
         na_label="na",
         fa_label="fa",
@@ -778,7 +961,7 @@ def test_maybe_render_plot_success_path(capsys: pytest.CaptureFixture[str], monk
         out_svg=criterion_dim_plot.Path("out.svg"),
         title="t",
         stat="median",
-        dims=(2,),
+        rows=(criterion_dim_plot.Row(2, 1.0, 0.9, 1.1, 2.0, 1.9, 2.1, 3.0, 2.9, 3.1),),
         la_label="la",
         na_label="na",
         fa_label="fa",
@@ -807,7 +990,7 @@ def test_maybe_update_readme_errors(tmp_path: Path, capsys: pytest.CaptureFixtur
     assert "No such file or directory" in captured.err
 
 
-def test_main_error_paths(tmp_path: Path) -> None:
+def test_main_error_paths(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     # Missing Criterion directory.
     rc = criterion_dim_plot.main(
         [
@@ -835,31 +1018,33 @@ def test_main_error_paths(tmp_path: Path) -> None:
         ]
     )
     assert rc == 2
+    assert "No benchmark results found to plot for the selected metric/stat." in capsys.readouterr().err
 
 
-def test_main_requires_canonical_dimensions_before_writing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    criterion_dir = tmp_path / "criterion"
-    metric = criterion_dim_plot.METRICS["lu_solve"]
-    for bench in (metric.la_bench, metric.na_bench, metric.fa_bench):
-        estimates = criterion_dir / "d2" / bench / "new" / "estimates.json"
-        estimates.parent.mkdir(parents=True, exist_ok=True)
-        estimates.write_text(
-            json.dumps(
-                {
-                    "median": {
-                        "point_estimate": 1.0,
-                        "confidence_interval": {"lower_bound": 0.9, "upper_bound": 1.1},
-                    }
-                }
-            ),
-            encoding="utf-8",
-        )
+@pytest.fixture(scope="module")
+def criterion_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Valid `new` median estimates for every metric at D=2 and D=3, shared read-only."""
+    criterion_dir = tmp_path_factory.mktemp("criterion")
+    for metric in criterion_dim_plot.METRICS.values():
+        for dim in (2, 3):
+            for bench in (metric.la_bench, metric.na_bench, metric.fa_bench):
+                _write_estimates(criterion_dir / f"d{dim}" / bench / "new" / "estimates.json", 1.0)
+    return criterion_dir
+
+
+def test_main_requires_canonical_dimensions_before_writing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    criterion_tree: Path,
+) -> None:
     output = tmp_path / "out.csv"
     monkeypatch.setattr(criterion_dim_plot, "_repo_root", lambda: tmp_path)
 
-    rc = criterion_dim_plot.main(["--criterion-dir", str(criterion_dir), "--csv", str(output), "--no-plot"])
+    rc = criterion_dim_plot.main(["--criterion-dir", str(criterion_tree), "--csv", str(output), "--no-plot"])
 
     assert rc == 2
+    assert "Canonical benchmark coverage is incomplete; no CSV" in capsys.readouterr().err
     assert not output.exists()
     assert not output.with_suffix(".provenance.json").exists()
 
@@ -867,30 +1052,15 @@ def test_main_requires_canonical_dimensions_before_writing(tmp_path: Path, monke
 def test_main_partial_mode_is_explicit_and_labels_measurement_unavailable(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
+    criterion_tree: Path,
 ) -> None:
-    criterion_dir = tmp_path / "criterion"
-    metric = criterion_dim_plot.METRICS["lu_solve"]
-    for bench in (metric.la_bench, metric.na_bench, metric.fa_bench):
-        estimates = criterion_dir / "d2" / bench / "new" / "estimates.json"
-        estimates.parent.mkdir(parents=True, exist_ok=True)
-        estimates.write_text(
-            json.dumps(
-                {
-                    "median": {
-                        "point_estimate": 1.0,
-                        "confidence_interval": {"lower_bound": 0.9, "upper_bound": 1.1},
-                    }
-                }
-            ),
-            encoding="utf-8",
-        )
     output = tmp_path / "out.csv"
     monkeypatch.setattr(criterion_dim_plot, "_repo_root", lambda: tmp_path)
 
     rc = criterion_dim_plot.main(
         [
             "--criterion-dir",
-            str(criterion_dir),
+            str(criterion_tree),
             "--csv",
             str(output),
             "--no-plot",
@@ -899,11 +1069,93 @@ def test_main_partial_mode_is_explicit_and_labels_measurement_unavailable(
     )
 
     assert rc == 0
-    provenance = json.loads(output.with_suffix(".provenance.json").read_text(encoding="utf-8"))
+    provenance = json.loads(output.with_suffix(".provenance.json").read_bytes())
     assert provenance["measurement"]["status"] == "unavailable"
     assert provenance["publication"]["correctness_gate"] == "not-run-exploratory"
 
 
+def test_main_all_metrics_shares_one_scan_and_environment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    criterion_tree: Path,
+) -> None:
+    listed: list[Path] = []
+    captured: list[Path] = []
+    bench_dirs = criterion_dim_plot._bench_dirs
+    capture_environment = criterion_dim_plot._capture_environment
+
+    def counting_bench_dirs(group_dir: Path) -> set[str]:
+        listed.append(group_dir)
+        return bench_dirs(group_dir)
+
+    def counting_capture_environment(root: Path) -> dict[str, object]:
+        captured.append(root)
+        return capture_environment(root)
+
+    monkeypatch.setattr(criterion_dim_plot, "_repo_root", lambda: tmp_path)
+    monkeypatch.setattr(criterion_dim_plot, "_bench_dirs", counting_bench_dirs)
+    monkeypatch.setattr(criterion_dim_plot, "_capture_environment", counting_capture_environment)
+
+    rc = criterion_dim_plot.main(["--metric", "all", "--criterion-dir", str(criterion_tree), "--no-plot", "--allow-partial"])
+
+    assert rc == 0
+    assert listed == [criterion_tree / "d2", criterion_tree / "d3"]
+    assert captured == [tmp_path]
+    for name in criterion_dim_plot.METRICS:
+        csv_path = tmp_path / "docs" / "assets" / "bench" / f"vs_linalg_{name}_median.csv"
+        assert len(csv_path.read_text(encoding="utf-8").splitlines()) == 3
+        provenance = json.loads(csv_path.with_suffix(".provenance.json").read_bytes())
+        assert provenance["criterion"]["metric"] == name
+
+
+def test_main_all_metrics_names_each_metric_in_diagnostics(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    criterion_tree: Path,
+) -> None:
+    monkeypatch.setattr(criterion_dim_plot, "_repo_root", lambda: tmp_path)
+
+    rc = criterion_dim_plot.main(["--metric", "all", "--criterion-dir", str(criterion_tree), "--no-plot"])
+
+    assert rc == 2
+    err = capsys.readouterr().err
+    for name in criterion_dim_plot.METRICS:
+        assert f"Canonical benchmark coverage for {name} is incomplete; no CSV" in err
+    assert not (tmp_path / "docs").exists()
+
+    empty_dir = tmp_path / "criterion"
+    (empty_dir / "d2").mkdir(parents=True)
+    rc = criterion_dim_plot.main(["--metric", "all", "--criterion-dir", str(empty_dir), "--no-plot", "--allow-partial"])
+
+    assert rc == 2
+    assert "No benchmark results found to plot for metric lu_solve (median)." in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "message"),
+    [
+        (["--update-readme"], "cannot be combined with --update-readme"),
+        (["--csv", "out.csv"], "--out and --csv are not supported"),
+        (["--out", "out.svg"], "--out and --csv are not supported"),
+    ],
+)
+def test_main_all_metrics_rejects_single_artifact_options(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    extra_args: list[str],
+    message: str,
+) -> None:
+    monkeypatch.setattr(criterion_dim_plot, "_repo_root", lambda: tmp_path)
+
+    rc = criterion_dim_plot.main(["--metric", "all", "--criterion-dir", str(tmp_path), *extra_args])
+
+    assert rc == 2
+    assert message in capsys.readouterr().err
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_main_rejects_missing_confidence_interval_without_writing(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1005,7 +1257,7 @@ def test_main_publication_fails_closed_when_provenance_tool_is_unavailable(
     monkeypatch.setattr(criterion_dim_plot, "_run_publication_benchmarks", lambda _root, _metric: None)
     monkeypatch.setattr(criterion_dim_plot, "_detect_versions", lambda _root: {})
     monkeypatch.setattr(criterion_dim_plot, "_discover_dims", lambda _criterion_dir: [2])
-    monkeypatch.setattr(criterion_dim_plot, "_collect_rows", lambda *_args: ([row], []))
+    monkeypatch.setattr(criterion_dim_plot, "_collect_metric_rows", lambda *_args: [([row], [])])
     monkeypatch.setattr(
         criterion_dim_plot,
         "_capture_provenance",
@@ -1188,19 +1440,7 @@ def test_readme_publication_cannot_reuse_stale_new_samples(
 
     def write_dimension(dimension: int) -> None:
         for bench in (metric.la_bench, metric.na_bench, metric.fa_bench):
-            estimates = criterion_dir / f"d{dimension}" / bench / "new" / "estimates.json"
-            estimates.parent.mkdir(parents=True, exist_ok=True)
-            estimates.write_text(
-                json.dumps(
-                    {
-                        "median": {
-                            "point_estimate": 1.0,
-                            "confidence_interval": {"lower_bound": 0.9, "upper_bound": 1.1},
-                        }
-                    }
-                ),
-                encoding="utf-8",
-            )
+            _write_estimates(criterion_dir / f"d{dimension}" / bench / "new" / "estimates.json", 1.0)
 
     for dimension in criterion_dim_plot.CANONICAL_DIMS:
         write_dimension(dimension)
@@ -1275,7 +1515,7 @@ def test_staged_publication_leaves_existing_assets_unchanged_when_render_fails(
         out_svg=svg_path,
         title="title",
         stat="median",
-        dims=(2,),
+        rows=(row,),
         la_label="la-stack",
         na_label="nalgebra",
         fa_label="faer",